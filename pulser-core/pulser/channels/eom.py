@@ -14,6 +14,7 @@
 """Configuration parameters for a channel's EOM."""
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, fields
 from enum import Flag
 from itertools import chain
@@ -143,6 +144,21 @@ class RydbergEOM(BaseEOM):
         Returns:
             The possible detuning values when in between pulses.
         """
+        key = (float(rabi_frequency), float(detuning_on))
+        if key not in self._detuning_off_cache:
+            self._detuning_off_cache[key] = self._detuning_off_options(*key)
+        return np.array(self._detuning_off_cache[key])
+
+    @functools.cached_property
+    def _detuning_off_cache(
+        self,
+    ) -> dict[tuple[float, float], tuple[float, ...]]:
+        # Stored on the instance so that it doesn't keep the EOM alive
+        return {}
+
+    def _detuning_off_options(
+        self, rabi_frequency: float, detuning_on: float
+    ) -> tuple[float, ...]:
         # detuning = offset + lightshift
 
         # offset takes into account the lightshift when both beams are on
@@ -167,7 +183,7 @@ class RydbergEOM(BaseEOM):
             lightshifts.append(0.0)
 
         # We sum the offset to all lightshifts to get the effective detuning
-        return np.array(lightshifts) + offset
+        return tuple(lightshift + offset for lightshift in lightshifts)
 
     def _lightshift(
         self, rabi_frequency: float, *beams_on: RydbergBeam
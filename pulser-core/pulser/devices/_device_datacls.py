@@ -318,7 +318,7 @@ class BaseDevice(ABC):
                 f"{max_qubits} qubits."
             )
 
-    def _validate_atom_number(self, coords: list[np.ndarray]) -> None:
+    def _validate_atom_number(self, coords: np.ndarray) -> None:
         max_atom_num = cast(int, self.max_atom_num)
         if len(coords) > max_atom_num:
             raise ValueError(
@@ -329,7 +329,7 @@ class BaseDevice(ABC):
             )
 
     def _validate_atom_distance(
-        self, ids: list[QubitId], coords: list[np.ndarray], kind: str
+        self, ids: list[QubitId], coords: np.ndarray, kind: str
     ) -> None:
         def invalid_dists(dists: np.ndarray) -> np.ndarray:
             cond1 = dists - self.min_atom_distance < -(
@@ -357,7 +357,7 @@ class BaseDevice(ABC):
                 )
 
     def _validate_radial_distance(
-        self, ids: list[QubitId], coords: list[np.ndarray], kind: str
+        self, ids: list[QubitId], coords: np.ndarray, kind: str
     ) -> None:
         too_far = np.linalg.norm(coords, axis=1) > self.max_radial_distance
         if np.any(too_far):
@@ -387,7 +387,8 @@ class BaseDevice(ABC):
         self, coords_dict: dict[QubitId, np.ndarray], kind: str = "atoms"
     ) -> None:
         ids = list(coords_dict.keys())
-        coords = list(coords_dict.values())
+        # A single (N, D) array, instead of one conversion per check
+        coords = np.array(list(coords_dict.values()))
         if kind == "atoms" and not (
             "max_atom_num" in self._optional_parameters
             and self.max_atom_num is None
@@ -17,8 +17,9 @@ from __future__ import annotations
 
 import functools
 import itertools
+import weakref
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -176,9 +177,28 @@ class Pulse:
             post_phase_shift: Optionally lets you add a
                 phase shift (in rads) immediately after the end of the pulse.
         """
+        # Pulses are immutable, so identical constant pulses are shared
+        args = (duration, amplitude, detuning, phase, post_phase_shift)
+        key: Optional[tuple] = None
+        # Non-integer durations warn when rounded, so they aren't shared
+        if isinstance(duration, (int, np.integer)) and not any(
+            isinstance(arg, Parametrized) for arg in args
+        ):
+            try:
+                pulse = _CONSTANT_PULSES.get((cls, *args))
+            except TypeError:
+                # Unhashable arguments (e.g. arrays) are not shared
+                pulse = None
+            else:
+                key = (cls, *args)
+            if pulse is not None:
+                return pulse
         amplitude_wf = ConstantWaveform(duration, amplitude)
         detuning_wf = ConstantWaveform(duration, detuning)
-        return cls(amplitude_wf, detuning_wf, phase, post_phase_shift)
+        pulse = cls(amplitude_wf, detuning_wf, phase, post_phase_shift)
+        if key is not None:
+            _CONSTANT_PULSES[key] = pulse
+        return pulse
 
     def draw(self) -> None:
         """Draws the pulse's amplitude and frequency waveforms."""
@@ -193,6 +213,17 @@ class Pulse:
 
     def fall_time(self, channel: Channel, in_eom_mode: bool = False) -> int:
         """Calculates the extra time needed to ramp down to zero."""
+        key = (channel, in_eom_mode)
+        if key not in self._fall_times:
+            self._fall_times[key] = self._fall_time(channel, in_eom_mode)
+        return self._fall_times[key]
+
+    @functools.cached_property
+    def _fall_times(self) -> dict[tuple[Channel, bool], int]:
+        # Stored on the instance so that it doesn't keep the pulse alive
+        return {}
+
+    def _fall_time(self, channel: Channel, in_eom_mode: bool) -> int:
         aligned_start_extra_time = (
             channel.rise_time
             if not in_eom_mode
@@ -240,3 +271,8 @@ class Pulse:
 
 # Replicate __init__'s signature in __new__
 functools.update_wrapper(Pulse.__new__, Pulse.__init__)
+
+# Constant pulses shared by Pulse.ConstantPulse(), while they are in use
+_CONSTANT_PULSES: weakref.WeakValueDictionary[
+    tuple, Pulse
+] = weakref.WeakValueDictionary()
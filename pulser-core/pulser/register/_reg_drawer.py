@@ -56,7 +56,7 @@ class RegDrawer:
         draw_graph: bool = True,
         draw_half_radius: bool = False,
         qubit_colors: Mapping[QubitId, str] = dict(),
-        masked_qubits: set[QubitId] = set(),
+        masked_qubits: frozenset[QubitId] = frozenset(),
         are_traps: bool = False,
     ) -> None:
         ordered_qubit_colors = RegDrawer._compute_ordered_qubit_colors(
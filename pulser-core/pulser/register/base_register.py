@@ -127,7 +127,8 @@ class BaseRegister(ABC):
                 "The IDs list must be selected among the IDs of the register's"
                 " qubits."
             )
-        return [self.qubit_ids.index(id_) for id_ in id_list]
+        indices = {id_: i for i, id_ in enumerate(self.qubit_ids)}
+        return [indices[id_] for id_ in id_list]
 
     @classmethod
     def from_coordinates(
@@ -197,12 +198,11 @@ class BaseRegister(ABC):
                 " in the register."
             )
 
-        for reg_coord, trap_id in zip(self._coords, trap_ids):
-            if np.any(reg_coord != trap_coords[trap_id]):
-                raise ValueError(
-                    "The chosen traps from the RegisterLayout don't match this"
-                    " register's coordinates."
-                )
+        if np.any(np.array(self._coords) != trap_coords[list(trap_ids)]):
+            raise ValueError(
+                "The chosen traps from the RegisterLayout don't match this"
+                " register's coordinates."
+            )
 
     @abstractmethod
     def _to_dict(self) -> dict[str, Any]:
@@ -240,12 +240,9 @@ class BaseRegister(ABC):
         if type(other) is not type(self):
             return False
 
-        return list(self._ids) == list(other._ids) and all(
-            (
-                np.allclose(  # Accounts for rounding errors
-                    self._coords[i],
-                    other._coords[other._ids.index(id)],
-                )
-                for i, id in enumerate(self._ids)
-            )
+        # With matching ids, the coordinates are in the same order
+        return list(self._ids) == list(other._ids) and np.allclose(
+            # Accounts for rounding errors
+            np.array(self._coords),
+            np.array(other._coords),
         )
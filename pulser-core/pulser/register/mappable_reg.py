@@ -44,6 +44,7 @@ class MappableRegister:
                 f"traps in this layout ({self._layout.number_of_traps})."
             )
         self._qubit_ids = qubit_ids
+        self._qubit_id_set = frozenset(qubit_ids)
 
     @property
     def qubit_ids(self) -> tuple[QubitId, ...]:
@@ -68,7 +69,7 @@ class MappableRegister:
             The resulting register.
         """
         chosen_ids = tuple(qubits.keys())
-        if not set(chosen_ids) <= set(self._qubit_ids):
+        if not self._qubit_id_set.issuperset(chosen_ids):
             raise ValueError(
                 "All qubits must be labeled with pre-declared qubit IDs."
             )
@@ -116,7 +117,7 @@ class MappableRegister:
             Indices of the qubits to denote, only valid for the
             given mapping.
         """
-        if not set(id_list) <= set(self._qubit_ids):
+        if not self._qubit_id_set.issuperset(id_list):
             raise ValueError(
                 "The IDs list must be selected among pre-declared qubit IDs."
             )
@@ -78,7 +78,7 @@ class _TargetSlot:
 class _SlmMask:
     """Auxiliary class to store the SLM mask configuration."""
 
-    targets: set[QubitId] = field(default_factory=set)
+    targets: frozenset[QubitId] = field(default_factory=frozenset)
     end: int = 0
 
 
@@ -14,12 +14,16 @@
 """Class for tracking the phase and usage of a qubit over time."""
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Generator, Union
 
 import numpy as np
 
 
 class _QubitRef:
+    # One is created per qubit and basis, so the per-instance dict is dropped
+    __slots__ = ("phase", "last_used")
+
     def __init__(self) -> None:
         self.phase = _PhaseTracker(0)
         self.last_used = 0
@@ -28,12 +32,15 @@ class _QubitRef:
         self.phase[self.last_used] = self.phase.last_phase + phi
 
     def update_last_used(self, new_t: int) -> None:
-        self.last_used = max(self.last_used, new_t)
+        if new_t > self.last_used:
+            self.last_used = new_t
 
 
 class _PhaseTracker:
     """Tracks a phase reference over time."""
 
+    __slots__ = ("_times", "_phases")
+
     def __init__(self, initial_phase: float):
         self._times: list[int] = [0]
         self._phases: list[float] = [self._format(initial_phase)]
@@ -53,9 +60,8 @@ class _PhaseTracker:
         time_scale: float = 1.0,
     ) -> Generator[tuple[float, float], None, None]:
         """Changes in phases within ]ti, tf]."""
-        start, end = np.searchsorted(
-            self._times, (ti * time_scale, tf * time_scale), side="right"
-        )
+        start = bisect_right(self._times, ti * time_scale)
+        end = bisect_right(self._times, tf * time_scale)
         for i in range(start, end):
             change = self._phases[i] - self._phases[i - 1]
             yield (self._times[i] / time_scale, change)
@@ -65,14 +71,15 @@ class _PhaseTracker:
 
     def __setitem__(self, t: int, phi: float) -> None:
         phase = self._format(phi)
-        if t in self._times:
-            ind = self._times.index(t)
-            self._phases[ind] = phase
+        # The times are sorted, so bisecting avoids converting them to an
+        # array (as np.searchsorted() would) and scanning them for 't'
+        ind = bisect_right(self._times, t)
+        if ind > 0 and self._times[ind - 1] == t:
+            self._phases[ind - 1] = phase
         else:
-            ind = int(np.searchsorted(self._times, t, side="right"))
             self._times.insert(ind, t)
             self._phases.insert(ind, phase)
 
     def __getitem__(self, t: int) -> float:
-        ind = int(np.searchsorted(self._times, t, side="right")) - 1
+        ind = bisect_right(self._times, t) - 1
         return self._phases[ind]
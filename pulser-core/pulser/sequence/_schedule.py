@@ -54,22 +54,50 @@ class _ChannelSchedule:
     def __post_init__(self) -> None:
         self.slots: list[_TimeSlot] = []
         self.eom_blocks: list[_EOMSettings] = []
+        # Tail pointers, kept up to date by append_slot()
+        self._last_target_tf = 0
+        # Indices (rather than slots) survive in-place slot replacements
+        self._first_pulse_ind: Optional[int] = None
+        self._last_pulse_ind: Optional[int] = None
+        self._last_non_detuned_pulse_ind: Optional[int] = None
+        # Last computed duration with fall time, with the state it matches
+        self._duration_with_fall_time: tuple[tuple[int, bool], int] = (
+            (0, False),
+            0,
+        )
+
+    def append_slot(self, slot: _TimeSlot) -> None:
+        """Appends a slot to the schedule, updating the tail pointers."""
+        if slot.type == "target":
+            self._last_target_tf = slot.tf
+        elif isinstance(slot.type, Pulse):
+            if self._first_pulse_ind is None:
+                self._first_pulse_ind = len(self.slots)
+            self._last_pulse_ind = len(self.slots)
+            if not self.is_detuned_delay(slot.type):
+                self._last_non_detuned_pulse_ind = len(self.slots)
+        self.slots.append(slot)
 
     def last_target(self) -> int:
         """Last time a target happened on the channel."""
-        for slot in self.slots[::-1]:
-            if slot.type == "target":
-                return slot.tf
-        return 0  # pragma: no cover
+        return self._last_target_tf
+
+    def first_pulse_slot(self) -> Optional[_TimeSlot]:
+        """The first slot with a Pulse, if there is one."""
+        if self._first_pulse_ind is None:
+            return None
+        return self.slots[self._first_pulse_ind]
 
     def last_pulse_slot(self, ignore_detuned_delay: bool = False) -> _TimeSlot:
         """The last slot with a Pulse."""
-        for slot in self.slots[::-1]:
-            if isinstance(slot.type, Pulse) and not (
-                ignore_detuned_delay and self.is_detuned_delay(slot.type)
-            ):
-                return slot
-        raise RuntimeError("There is no slot with a pulse.")
+        ind = (
+            self._last_non_detuned_pulse_ind
+            if ignore_detuned_delay
+            else self._last_pulse_ind
+        )
+        if ind is None:
+            raise RuntimeError("There is no slot with a pulse.")
+        return self.slots[ind]
 
     def in_eom_mode(self, time_slot: Optional[_TimeSlot] = None) -> bool:
         """States if a time slot is inside an EOM mode block."""
@@ -100,13 +128,25 @@ class _ChannelSchedule:
         ]
 
     def get_duration(self, include_fall_time: bool = False) -> int:
-        temp_tf = 0
-        for i, op in enumerate(self.slots[::-1]):
-            if i == 0:
-                # Start with the last slot found
-                temp_tf = op.tf
-                if not include_fall_time:
-                    break
+        if not self.slots:
+            return 0
+        if not include_fall_time:
+            # The last slot is always the last one to finish
+            return self.slots[-1].tf
+        # Slots are only ever appended and the fall time depends only on
+        # the EOM mode status, so these identify the result
+        state = (len(self.slots), self.in_eom_mode())
+        if self._duration_with_fall_time[0] != state:
+            self._duration_with_fall_time = (
+                state,
+                self._find_duration_with_fall_time(),
+            )
+        return self._duration_with_fall_time[1]
+
+    def _find_duration_with_fall_time(self) -> int:
+        # Start with the last slot found
+        temp_tf = self.slots[-1].tf
+        for op in self.slots[::-1]:
             if isinstance(op.type, Pulse):
                 temp_tf = max(
                     temp_tf,
@@ -123,11 +163,13 @@ class _ChannelSchedule:
 
     def adjust_duration(self, duration: int) -> int:
         """Adjust a duration for this channel."""
+        duration = max(duration, self.channel_obj.min_duration)
+        if duration % self.channel_obj.clock_period == 0:
+            # No rounding needed, so there is no warning to silence
+            return self.channel_obj.validate_duration(duration)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            return self.channel_obj.validate_duration(
-                max(duration, self.channel_obj.min_duration)
-            )
+            return self.channel_obj.validate_duration(duration)
 
     def get_samples(
         self, ignore_detuned_delay_phase: bool = True
@@ -138,6 +180,10 @@ class _ChannelSchedule:
         dt = self.get_duration()
         amp, det, phase = np.zeros(dt), np.zeros(dt), np.zeros(dt)
         slots: list[_TargetSlot] = []
+        eom_intervals = self.get_eom_mode_intervals()
+        ph_jump_t = self.channel_obj.phase_jump_time
+        # The last pulse whose phase was considered
+        last_pulse_slot: Optional[_TimeSlot] = None
 
         for ind, s in enumerate(channel_slots):
             pulse = cast(Pulse, s.type)
@@ -148,7 +194,10 @@ class _ChannelSchedule:
             # Account for the extended duration of the pulses
             # after modulation, which is at most fall_time
             fall_time = pulse.fall_time(
-                self.channel_obj, in_eom_mode=self.in_eom_mode(time_slot=s)
+                self.channel_obj,
+                in_eom_mode=any(
+                    start <= s.ti < end for start, end in eom_intervals
+                ),
             )
             tf += (
                 min(fall_time, channel_slots[ind + 1].ti - s.tf)
@@ -161,22 +210,13 @@ class _ChannelSchedule:
                 # The phase of detuned delays is not considered
                 continue
 
-            ph_jump_t = self.channel_obj.phase_jump_time
-            for last_pulse_ind in range(ind - 1, -1, -1):  # From ind-1 to 0
-                last_pulse_slot = channel_slots[last_pulse_ind]
-                # Skips over detuned delay pulses
-                if not (
-                    ignore_detuned_delay_phase
-                    and self.is_detuned_delay(
-                        cast(Pulse, last_pulse_slot.type)
-                    )
-                ):
-                    # Accounts for when pulse is added with 'no-delay'
-                    # i.e. there is no phase_jump_time in between a phase jump
-                    t_start = max(s.ti - ph_jump_t, last_pulse_slot.tf)
-                    break
-            else:
+            if last_pulse_slot is None:
                 t_start = 0
+            else:
+                # Accounts for when pulse is added with 'no-delay'
+                # i.e. there is no phase_jump_time in between a phase jump
+                t_start = max(s.ti - ph_jump_t, last_pulse_slot.tf)
+            last_pulse_slot = s
             # Overrides all values from t_start on. The next pulses will do
             # the same, so the last phase is automatically kept till the end
             phase[t_start:] = pulse.phase
@@ -222,18 +262,11 @@ class _Schedule(Dict[str, _ChannelSchedule]):
         for ch_schedule in self.values():
             if ch_schedule.channel_obj.addressing != "Global":
                 continue
-            # Cycle on slots in schedule until the first pulse is found
-            for slot in ch_schedule:
-                if not isinstance(slot.type, Pulse):
-                    continue
-                ti = slot.ti
-                tf = slot.tf
-                if mask_time:
-                    if ti < mask_time[0]:
-                        mask_time = [ti, tf]
-                else:
-                    mask_time = [ti, tf]
-                break
+            slot = ch_schedule.first_pulse_slot()
+            if slot is None:
+                continue
+            if not mask_time or slot.ti < mask_time[0]:
+                mask_time = [slot.ti, slot.tf]
         return mask_time
 
     def enable_eom(
@@ -329,7 +362,7 @@ class _Schedule(Dict[str, _ChannelSchedule]):
 
         ti = t0 + delay_duration
         tf = ti + pulse.duration
-        self[channel].slots.append(_TimeSlot(pulse, ti, tf, last.targets))
+        self[channel].append_slot(_TimeSlot(pulse, ti, tf, last.targets))
 
     def add_delay(self, duration: int, channel: str) -> None:
         last = self[channel][-1]
@@ -343,13 +376,11 @@ class _Schedule(Dict[str, _ChannelSchedule]):
             delay_pulse = Pulse.ConstantPulse(
                 tf - ti, 0.0, self[channel].eom_blocks[-1].detuning_off, phase
             )
-            self[channel].slots.append(
+            self[channel].append_slot(
                 _TimeSlot(delay_pulse, ti, tf, last.targets)
             )
         else:
-            self[channel].slots.append(
-                _TimeSlot("delay", ti, tf, last.targets)
-            )
+            self[channel].append_slot(_TimeSlot("delay", ti, tf, last.targets))
 
     def add_target(self, qubits_set: set[QubitId], channel: str) -> None:
         channel_obj = self[channel].channel_obj
@@ -362,7 +393,7 @@ class _Schedule(Dict[str, _ChannelSchedule]):
             ti = last.tf
             retarget = cast(int, channel_obj.min_retarget_interval)
             elapsed = ti - self[channel].last_target()
-            delta = cast(int, np.clip(retarget - elapsed, 0, retarget))
+            delta = min(max(retarget - elapsed, 0), retarget)
             if channel_obj.fixed_retarget_t:
                 delta = max(delta, channel_obj.fixed_retarget_t)
             if delta != 0:
@@ -373,9 +404,7 @@ class _Schedule(Dict[str, _ChannelSchedule]):
             ti = -1
             tf = 0
 
-        self[channel].slots.append(
-            _TimeSlot("target", ti, tf, set(qubits_set))
-        )
+        self[channel].append_slot(_TimeSlot("target", ti, tf, set(qubits_set)))
 
     def wait_for_fall(self, channel: str) -> None:
         """Adds a delay to let the channel's amplitude ramp down."""
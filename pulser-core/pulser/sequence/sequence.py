@@ -19,7 +19,7 @@ import copy
 import json
 import os
 import warnings
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import (
     Any,
     Generic,
@@ -127,7 +127,7 @@ class Sequence(Generic[DeviceType]):
         self._schedule: _Schedule = _Schedule()
         self._basis_ref: dict[str, dict[QubitId, _QubitRef]] = {}
         # IDs of all qubits in device
-        self._qids: set[QubitId] = set(self._register.qubit_ids)
+        self._qids: frozenset[QubitId] = frozenset(self._register.qubit_ids)
         # Last time each qubit was used, by basis
         self._variables: dict[str, Variable] = {}
         self._to_build_calls: list[_Call] = []
@@ -135,7 +135,9 @@ class Sequence(Generic[DeviceType]):
         # Marks the sequence as empty until the first pulse is added
         self._empty_sequence: bool = True
         # SLM mask targets and on/off times
-        self._slm_mask_targets: set[QubitId] = set()
+        self._slm_mask_targets: frozenset[QubitId] = frozenset()
+        # Outputs of __str__() and serialize(), with the state they match
+        self._output_cache: dict[str, tuple[tuple, str]] = {}
 
         # Initializes all parametrized Sequence related attributes
         self._reset_parametrized()
@@ -422,12 +424,16 @@ class Sequence(Generic[DeviceType]):
             )
 
         try:
-            targets = set(qubits)
+            targets = frozenset(qubits)
         except TypeError:
             raise TypeError("The SLM targets must be castable to set.")
 
-        if not targets.issubset(self._qids):
-            raise ValueError("SLM mask targets must exist in the register.")
+        missing = targets - self._qids
+        if missing:
+            raise ValueError(
+                "SLM mask targets must exist in the register. "
+                f"Wrong target: {next(iter(missing))!r}."
+            )
 
         if self.is_parametrized():
             return
@@ -665,7 +671,9 @@ class Sequence(Generic[DeviceType]):
             self._basis_ref[ch.basis] = {q: _QubitRef() for q in self._qids}
 
         if ch.addressing == "Global":
-            self._add_to_schedule(name, _TimeSlot("target", -1, 0, self._qids))
+            self._add_to_schedule(
+                name, _TimeSlot("target", -1, 0, set(self._qids))
+            )
         elif initial_target is not None:
             if self.is_parametrized():
                 # Do not store "initial_target" in a _call when parametrized
@@ -1210,6 +1218,7 @@ class Sequence(Generic[DeviceType]):
         # Deepcopy the base sequence (what remains)
         seq = copy.deepcopy(seq)
         # NOTE: Changes to seq are now safe to do
+        seq._output_cache = {}
 
         if not (self.is_parametrized() or self.is_register_mappable()):
             warnings.warn(
@@ -1253,7 +1262,11 @@ class Sequence(Generic[DeviceType]):
             ``json.dumps``: Built-in function for serialization to a JSON
             formatted string.
         """
-        return json.dumps(self, cls=PulserEncoder, **kwargs)
+        if kwargs:
+            return json.dumps(self, cls=PulserEncoder, **kwargs)
+        return self._get_cached_output(
+            "serialize", lambda: json.dumps(self, cls=PulserEncoder)
+        )
 
     def to_abstract_repr(
         self,
@@ -1593,11 +1606,29 @@ class Sequence(Generic[DeviceType]):
         return d
 
     def __str__(self) -> str:
-        return seq_to_str(self)
+        if self.is_register_mappable():
+            # Not cached, so that the mappable register warning is always shown
+            return seq_to_str(self)
+        return self._get_cached_output("str", lambda: seq_to_str(self))
+
+    def _get_cached_output(self, key: str, compute: Callable[[], str]) -> str:
+        """Returns a cached output, recomputing it if the sequence changed."""
+        # Every change to the sequence stores a new call or variable
+        state = (
+            len(self._calls),
+            len(self._to_build_calls),
+            len(self._variables),
+            self._building,
+        )
+        cached = self._output_cache.get(key)
+        if cached is None or cached[0] != state:
+            cached = (state, compute())
+            self._output_cache[key] = cached
+        return cached[1]
 
     def _add_to_schedule(self, channel: str, timeslot: _TimeSlot) -> None:
         # Maybe get rid of this
-        self._schedule[channel].slots.append(timeslot)
+        self._schedule[channel].append_slot(timeslot)
 
     def _last(self, channel: str) -> _TimeSlot:
         """Shortcut to last element in the channel's schedule."""
@@ -1679,7 +1710,7 @@ class Sequence(Generic[DeviceType]):
                 " have not been assigned a trap."
             )
         seq._register = reg
-        seq._qids = qids
+        seq._qids = frozenset(qids)
         seq._calls[0] = _Call("__init__", (seq._register, seq._device), {})
 
     def _cross_check_vars(self, vars: dict[str, Any]) -> None:
@@ -300,7 +300,12 @@ class Waveform(ABC):
             return bool(np.all(np.isclose(self.samples, other.samples)))
 
     def __hash__(self) -> int:
-        return hash(tuple(self.samples))
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        # Waveforms are immutable, so the (costly) hash is computed only once
+        return hash(tuple(self._samples))
 
     def _plot(
         self,
@@ -615,12 +620,9 @@ class BlackmanWaveform(Waveform):
                 f"type {type(area)} was provided."
             )
 
-        self._norm_samples: np.ndarray = np.clip(
-            np.blackman(self._duration), 0, np.inf
-        )
-        self._scaling: float = (
-            self._area / float(np.sum(self._norm_samples)) / 1e-3
-        )
+        self._norm_samples: np.ndarray
+        self._norm_samples, norm_sum = _blackman_window(self._duration)
+        self._scaling: float = self._area / norm_sum / 1e-3
 
     @classmethod
     @parametrize
@@ -1085,6 +1087,17 @@ class KaiserWaveform(Waveform):
         )
 
 
+@functools.lru_cache(maxsize=512)
+def _blackman_window(duration: int) -> tuple[np.ndarray, float]:
+    """The (read-only) normalized Blackman window and the sum of its values.
+
+    Shared by all Blackman waveforms with the same duration.
+    """
+    window = np.clip(np.blackman(duration), 0, np.inf)
+    window.setflags(write=False)
+    return window, float(np.sum(window))
+
+
 # To replicate __init__'s signature in __new__ for every Waveform subclass
 def _copy_func(f: FunctionType) -> FunctionType:
     return FunctionType(
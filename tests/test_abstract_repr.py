@@ -912,7 +912,7 @@ class TestDeserialization:
         )
         _check_roundtrip(s)
         seq = Sequence.from_abstract_repr(json.dumps(s))
-        assert np.all(seq.magnetic_field == mag_field)
+        assert np.array_equal(seq.magnetic_field, mag_field)
 
     @pytest.mark.parametrize("without_default", [True, False])
     def test_deserialize_variables(self, without_default):
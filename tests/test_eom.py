@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import weakref
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
 from pulser.channels.eom import MODBW_TO_TR, RydbergBeam, RydbergEOM
@@ -136,3 +141,26 @@ def test_detuning_off(limit_amp_fraction, params):
         # The new detuning_off is shifted by the new detuning_on,
         # since that changes the offset compared the resonant case
         assert off_options[0] == det_off_options[ind] + detuning_on
+
+
+def test_detuning_off_cache(params):
+    eom = RydbergEOM(**params)
+    det_off_options = eom.detuning_off_options(10.0, 1.0)
+    # Repeated calls reuse the computed options
+    with patch.object(
+        RydbergEOM, "_detuning_off_options", side_effect=AssertionError
+    ):
+        np.testing.assert_array_equal(
+            eom.detuning_off_options(10, 1), det_off_options
+        )
+    # Changing the returned array does not change the cached options
+    det_off_options[:] = 0.0
+    assert np.all(eom.detuning_off_options(10.0, 1.0) != 0.0)
+    # The cache is not part of the EOM's identity and doesn't keep it alive
+    assert eom == RydbergEOM(**params)
+    assert "_detuning_off_cache" not in repr(eom)
+    assert "_detuning_off_cache" not in eom._to_dict()["__kwargs__"]
+    eom_ref = weakref.ref(eom)
+    del eom
+    gc.collect()
+    assert eom_ref() is None
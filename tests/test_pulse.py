@@ -11,6 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import gc
+import weakref
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
@@ -51,6 +55,12 @@ def test_creation():
     assert pls4.detuning != cwf
     assert pls4.amplitude == pls.amplitude
 
+    # Identical constant pulses are shared
+    assert Pulse.ConstantPulse(100, 1, -10, -np.pi) is pls2
+    assert Pulse.ConstantPulse(100, 1, -10, 0) is not pls2
+    arr_pls = Pulse.ConstantPulse(100, np.array([1]), -10, -np.pi)
+    assert arr_pls == pls2 and arr_pls is not pls2
+
 
 def test_str():
     assert pls2.__str__() == (
@@ -93,3 +103,26 @@ def test_fall_time():
     pulse = Pulse.ConstantPulse(1000, 1, 0, 0)
     assert pulse.fall_time(channel, in_eom_mode=False) == 240
     assert pulse.fall_time(channel, in_eom_mode=True) == 40
+
+    # Repeated calls reuse the value computed for the same channel
+    with patch.object(
+        ConstantWaveform, "modulation_buffers", side_effect=AssertionError
+    ):
+        assert pulse.fall_time(channel, in_eom_mode=False) == 240
+        assert pulse.fall_time(channel, in_eom_mode=True) == 40
+
+    # The cached values do not keep the pulse alive
+    pulse = Pulse.ConstantPulse(1234, 2, -1, 0)
+    assert pulse.fall_time(channel) == 240
+    # The cache is not part of the pulse's identity
+    same_pulse = Pulse(
+        ConstantWaveform(1234, 2), ConstantWaveform(1234, -1), 0
+    )
+    assert pulse == same_pulse and hash(pulse) == hash(same_pulse)
+    assert repr(pulse) == repr(same_pulse)
+    assert pulse._to_dict() == same_pulse._to_dict()
+    del same_pulse
+    pulse_ref = weakref.ref(pulse)
+    del pulse
+    gc.collect()
+    assert pulse_ref() is None
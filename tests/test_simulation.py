@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from collections import Counter
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import numpy as np
@@ -26,8 +28,29 @@ from pulser.sampler import sampler
 from pulser.waveforms import BlackmanWaveform, ConstantWaveform, RampWaveform
 from pulser_simulation import QutipEmulator, SimConfig, Simulation
 
-
-@pytest.fixture
+_BASIS_2 = (qutip.basis(2, 0), qutip.basis(2, 1))
+_BASIS_3 = (qutip.basis(3, 0), qutip.basis(3, 1), qutip.basis(3, 2))
+_QEYE_2 = qutip.qeye(2)
+
+# SimConfig is frozen, so the configurations used by several tests are shared
+_DEPHASING_CFG = SimConfig(noise="dephasing")
+_DEPOLARIZING_CFG = SimConfig(noise="depolarizing")
+_SPAM_04_CFG = SimConfig("SPAM", eta=0.4)
+_SPAM_05_CFG = SimConfig("SPAM", eta=0.5)
+
+# Hamiltonian of test_get_hamiltonian's doppler-noise simulation at t=144 ns
+_HAM_NOISE_REF = np.array(
+    [
+        [4.47984523, 0.09606404, 0.09606404, 0.0],
+        [0.09606404, 12.03082372, 0.0, 0.09606404],
+        [0.09606404, 0.0, -12.97113702, 0.09606404],
+        [0.0, 0.09606404, 0.09606404, 0.0],
+    ],
+    dtype=complex,
+)
+
+
+@pytest.fixture(scope="module")
 def reg():
     q_dict = {
         "control1": np.array([-4.0, 0.0]),
@@ -37,9 +60,7 @@ def reg():
     return Register(q_dict)
 
 
-@pytest.fixture
-def seq(reg):
-    duration = 1000
+def _make_seq(reg, duration):
     pi = Pulse.ConstantDetuning(BlackmanWaveform(duration, np.pi), 0.0, 0)
     twopi = Pulse.ConstantDetuning(
         BlackmanWaveform(duration, 2 * np.pi), 0.0, 0
@@ -75,7 +96,29 @@ def seq(reg):
     return seq
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def seq(reg):
+    return _make_seq(reg, 1000)
+
+
+@pytest.fixture(scope="module")
+def short_seq(reg):
+    # Short enough for a fast simulation, long enough for the 2*pi Blackman
+    # pulse to stay below the local channels' maximum amplitude
+    return _make_seq(reg, 300)
+
+
+@pytest.fixture(scope="module")
+def sim(seq):
+    return Simulation(seq, sampling_rate=0.01)
+
+
+@pytest.fixture(scope="module")
+def square_reg():
+    return Register.square(2, prefix="atom")
+
+
+@pytest.fixture(scope="module")
 def matrices():
     pauli = {}
     pauli["I"] = qutip.qeye(2)
@@ -160,69 +203,61 @@ def test_initialization_and_construction_of_hamiltonian(seq, mod_device):
         Simulation(seq_)
 
 
-def test_extraction_of_sequences(seq):
-    sim = Simulation(seq)
-    for channel in seq.declared_channels:
-        addr = seq.declared_channels[channel].addressing
-        basis = seq.declared_channels[channel].basis
-
-        if addr == "Global":
-            for slot in seq._schedule[channel]:
-                if isinstance(slot.type, Pulse):
-                    samples = sim.samples[addr][basis]
-                    assert (
-                        samples["amp"][slot.ti : slot.tf]
-                        == slot.type.amplitude.samples
-                    ).all()
-                    assert (
-                        samples["det"][slot.ti : slot.tf]
-                        == slot.type.detuning.samples
-                    ).all()
-                    assert (
-                        samples["phase"][slot.ti : slot.tf] == slot.type.phase
-                    ).all()
-
-        elif addr == "Local":
-            for slot in seq._schedule[channel]:
-                if isinstance(slot.type, Pulse):
-                    for qubit in slot.targets:  # TO DO: multiaddressing??
-                        samples = sim.samples[addr][basis][qubit]
-                        assert (
-                            samples["amp"][slot.ti : slot.tf]
-                            == slot.type.amplitude.samples
-                        ).all()
-                        assert (
-                            samples["det"][slot.ti : slot.tf]
-                            == slot.type.detuning.samples
-                        ).all()
-                        assert (
-                            samples["phase"][slot.ti : slot.tf]
-                            == slot.type.phase
-                        ).all()
-
-
-def test_building_basis_and_projection_operators(seq, reg):
+def _assert_pulse_samples(samples, slots):
+    t_inds = np.concatenate([np.arange(slot.ti, slot.tf) for slot in slots])
+    np.testing.assert_array_equal(
+        samples["amp"][t_inds],
+        np.concatenate([slot.type.amplitude.samples for slot in slots]),
+    )
+    np.testing.assert_array_equal(
+        samples["det"][t_inds],
+        np.concatenate([slot.type.detuning.samples for slot in slots]),
+    )
+    np.testing.assert_array_equal(
+        samples["phase"][t_inds],
+        np.concatenate(
+            [np.full(slot.tf - slot.ti, slot.type.phase) for slot in slots]
+        ),
+    )
+
+
+def test_extraction_of_sequences(seq, sim):
+    for channel, ch_obj in seq.declared_channels.items():
+        basis_samples = sim.samples[ch_obj.addressing][ch_obj.basis]
+        pulse_slots = [
+            slot
+            for slot in seq._schedule[channel]
+            if isinstance(slot.type, Pulse)
+        ]
+        if ch_obj.addressing == "Global":
+            _assert_pulse_samples(basis_samples, pulse_slots)
+            continue
+        for qubit in set().union(*(slot.targets for slot in pulse_slots)):
+            _assert_pulse_samples(
+                basis_samples[qubit],
+                [slot for slot in pulse_slots if qubit in slot.targets],
+            )
+
+
+def _assert_projector(op, i, j):
+    # Checks that op is the dense |i><j| matrix
+    expected = np.zeros(op.shape, dtype=complex)
+    expected[i, j] = 1
+    np.testing.assert_array_equal(op.full(), expected)
+
+
+def test_building_basis_and_projection_operators(sim):
     # All three levels:
-    sim = Simulation(seq, sampling_rate=0.01)
     assert sim.basis_name == "all"
     assert sim.dim == 3
     assert sim.basis == {
-        "r": qutip.basis(3, 0),
-        "g": qutip.basis(3, 1),
-        "h": qutip.basis(3, 2),
+        "r": _BASIS_3[0],
+        "g": _BASIS_3[1],
+        "h": _BASIS_3[2],
     }
-    assert (
-        sim.op_matrix["sigma_rr"]
-        == qutip.basis(3, 0) * qutip.basis(3, 0).dag()
-    )
-    assert (
-        sim.op_matrix["sigma_gr"]
-        == qutip.basis(3, 1) * qutip.basis(3, 0).dag()
-    )
-    assert (
-        sim.op_matrix["sigma_hg"]
-        == qutip.basis(3, 2) * qutip.basis(3, 1).dag()
-    )
+    _assert_projector(sim.op_matrix["sigma_rr"], 0, 0)
+    _assert_projector(sim.op_matrix["sigma_gr"], 1, 0)
+    _assert_projector(sim.op_matrix["sigma_hg"], 2, 1)
 
     # Check local operator building method:
     with pytest.raises(ValueError, match="Duplicate atom"):
@@ -237,84 +272,69 @@ def test_building_basis_and_projection_operators(seq, reg):
     op_one = sim.build_operator(("sigma_gg", ["target"]))
     assert np.linalg.norm(op_standard - op_one) < 1e-10
 
-    # Global ground-rydberg
-    seq2 = Sequence(reg, Chadoq2)
-    seq2.declare_channel("global", "rydberg_global")
+
+@pytest.mark.parametrize(
+    "device, channel_id, initial_target, basis_name, states, projectors",
+    [
+        (
+            Chadoq2,
+            "rydberg_global",
+            None,
+            "ground-rydberg",
+            ("r", "g"),
+            {"sigma_rr": (0, 0), "sigma_gr": (1, 0)},
+        ),
+        (
+            Chadoq2,
+            "raman_local",
+            "target",
+            "digital",
+            ("g", "h"),
+            {"sigma_gg": (0, 0), "sigma_hg": (1, 0)},
+        ),
+        (
+            Chadoq2,
+            "rydberg_local",
+            "target",
+            "ground-rydberg",
+            ("r", "g"),
+            {"sigma_rr": (0, 0), "sigma_gr": (1, 0)},
+        ),
+        (
+            MockDevice,
+            "mw_global",
+            None,
+            "XY",
+            ("u", "d"),
+            {"sigma_uu": (0, 0), "sigma_du": (1, 0), "sigma_ud": (0, 1)},
+        ),
+    ],
+)
+def test_two_level_basis_and_projection_operators(
+    reg, device, channel_id, initial_target, basis_name, states, projectors
+):
+    seq = Sequence(reg, device)
+    seq.declare_channel("ch", channel_id, initial_target)
     pi_pls = Pulse.ConstantDetuning(BlackmanWaveform(1000, np.pi), 0.0, 0)
-    seq2.add(pi_pls, "global")
-    sim2 = Simulation(seq2, sampling_rate=0.01)
-    assert sim2.basis_name == "ground-rydberg"
-    assert sim2.dim == 2
-    assert sim2.basis == {"r": qutip.basis(2, 0), "g": qutip.basis(2, 1)}
-    assert (
-        sim2.op_matrix["sigma_rr"]
-        == qutip.basis(2, 0) * qutip.basis(2, 0).dag()
-    )
-    assert (
-        sim2.op_matrix["sigma_gr"]
-        == qutip.basis(2, 1) * qutip.basis(2, 0).dag()
-    )
+    seq.add(pi_pls, "ch")
+    sim = Simulation(seq, sampling_rate=0.01)
+    assert sim.basis_name == basis_name
+    assert sim.dim == 2
+    assert sim.basis == dict(zip(states, _BASIS_2))
+    for op_name, (i, j) in projectors.items():
+        _assert_projector(sim.op_matrix[op_name], i, j)
 
-    # Digital
-    seq2b = Sequence(reg, Chadoq2)
-    seq2b.declare_channel("local", "raman_local", "target")
-    seq2b.add(pi_pls, "local")
-    sim2b = Simulation(seq2b, sampling_rate=0.01)
-    assert sim2b.basis_name == "digital"
-    assert sim2b.dim == 2
-    assert sim2b.basis == {"g": qutip.basis(2, 0), "h": qutip.basis(2, 1)}
-    assert (
-        sim2b.op_matrix["sigma_gg"]
-        == qutip.basis(2, 0) * qutip.basis(2, 0).dag()
-    )
-    assert (
-        sim2b.op_matrix["sigma_hg"]
-        == qutip.basis(2, 1) * qutip.basis(2, 0).dag()
-    )
 
-    # Local ground-rydberg
-    seq2c = Sequence(reg, Chadoq2)
-    seq2c.declare_channel("local_ryd", "rydberg_local", "target")
-    seq2c.add(pi_pls, "local_ryd")
-    sim2c = Simulation(seq2c, sampling_rate=0.01)
-    assert sim2c.basis_name == "ground-rydberg"
-    assert sim2c.dim == 2
-    assert sim2c.basis == {"r": qutip.basis(2, 0), "g": qutip.basis(2, 1)}
-    assert (
-        sim2c.op_matrix["sigma_rr"]
-        == qutip.basis(2, 0) * qutip.basis(2, 0).dag()
-    )
-    assert (
-        sim2c.op_matrix["sigma_gr"]
-        == qutip.basis(2, 1) * qutip.basis(2, 0).dag()
-    )
-
-    # Global XY
-    seq2 = Sequence(reg, MockDevice)
-    seq2.declare_channel("global", "mw_global")
-    seq2.add(pi_pls, "global")
-    # seq2 cannot be run on Chadoq2 because it does not support mw
+def test_unsupported_basis(reg):
+    seq = Sequence(reg, MockDevice)
+    seq.declare_channel("global", "mw_global")
+    seq.add(Pulse.ConstantPulse(1000, 1, 0, 0), "global")
+    # seq cannot be run on Chadoq2 because it does not support mw
     with pytest.raises(
         ValueError,
         match="Bases used in samples should be supported by device.",
     ):
-        QutipEmulator(sampler.sample(seq2), seq2.register, Chadoq2)
-    sim2 = Simulation(seq2, sampling_rate=0.01)
-    assert sim2.basis_name == "XY"
-    assert sim2.dim == 2
-    assert sim2.basis == {"u": qutip.basis(2, 0), "d": qutip.basis(2, 1)}
-    assert (
-        sim2.op_matrix["sigma_uu"]
-        == qutip.basis(2, 0) * qutip.basis(2, 0).dag()
-    )
-    assert (
-        sim2.op_matrix["sigma_du"]
-        == qutip.basis(2, 1) * qutip.basis(2, 0).dag()
-    )
-    assert (
-        sim2.op_matrix["sigma_ud"]
-        == qutip.basis(2, 0) * qutip.basis(2, 1).dag()
-    )
+        QutipEmulator(sampler.sample(seq), seq.register, Chadoq2)
 
 
 def test_empty_sequences(reg):
@@ -358,32 +378,9 @@ def test_get_hamiltonian():
         simple_seq, config=SimConfig(noise="doppler", temperature=20000)
     )
     simple_ham_noise = simple_sim_noise.get_hamiltonian(144)
-    assert np.isclose(
-        simple_ham_noise.full(),
-        np.array(
-            [
-                [
-                    4.47984523 + 0.0j,
-                    0.09606404 + 0.0j,
-                    0.09606404 + 0.0j,
-                    0.0 + 0.0j,
-                ],
-                [
-                    0.09606404 + 0.0j,
-                    12.03082372 + 0.0j,
-                    0.0 + 0.0j,
-                    0.09606404 + 0.0j,
-                ],
-                [
-                    0.09606404 + 0.0j,
-                    0.0 + 0.0j,
-                    -12.97113702 + 0.0j,
-                    0.09606404 + 0.0j,
-                ],
-                [0.0 + 0.0j, 0.09606404 + 0.0j, 0.09606404 + 0.0j, 0.0 + 0.0j],
-            ]
-        ),
-    ).all()
+    np.testing.assert_allclose(
+        simple_ham_noise.full(), _HAM_NOISE_REF, rtol=1e-5, atol=1e-8
+    )
 
 
 def test_single_atom_simulation():
@@ -414,86 +411,114 @@ def test_add_max_step_and_delays():
     sim = Simulation(seq)
     res_large_max_step = sim.run(max_step=1)
     res_auto_max_step = sim.run()
-    r = qutip.basis(2, 0)
+    r = _BASIS_2[0]
     occ_large = res_large_max_step.expect([r.proj()])[0]
     occ_auto = res_auto_max_step.expect([r.proj()])[0]
     assert np.isclose(occ_large[-1], 0, 1e-4)
     assert np.isclose(occ_auto[-1], 0.5, 1e-4)
 
 
-def test_run(seq, patch_plt_show):
-    sim = Simulation(seq, sampling_rate=0.01)
+@pytest.fixture
+def run_sim(short_seq):
+    sim = Simulation(short_seq, sampling_rate=0.01)
     sim.set_config(SimConfig("SPAM", eta=0.0))
+    return sim
+
+
+def test_run_draw(run_sim, patch_plt_show):
     with patch("matplotlib.pyplot.savefig"):
-        sim.draw(draw_phase_area=True, fig_name="my_fig.pdf")
-    bad_initial = np.array([1.0])
-    good_initial_array = np.r_[1, np.zeros(sim.dim**sim._size - 1)]
-    good_initial_qobj = qutip.tensor(
-        [qutip.basis(sim.dim, 0) for _ in range(sim._size)]
-    )
-    good_initial_qobj_no_dims = qutip.basis(sim.dim**sim._size, 2)
+        run_sim.draw(draw_phase_area=True, fig_name="my_fig.pdf")
+
 
+def test_run_wrong_inputs(run_sim):
+    bad_initial = np.array([1.0])
     with pytest.raises(
         ValueError, match="Incompatible shape of initial state"
     ):
-        sim.set_initial_state(bad_initial)
+        run_sim.set_initial_state(bad_initial)
 
     with pytest.raises(
         ValueError, match="Incompatible shape of initial state"
     ):
-        sim.set_initial_state(qutip.Qobj(bad_initial))
+        run_sim.set_initial_state(qutip.Qobj(bad_initial))
 
     with pytest.warns(
         DeprecationWarning, match="Setting `initial_state` is deprecated"
     ):
-        sim.initial_state = good_initial_array
-
-    sim.set_initial_state(good_initial_array)
-    sim.run()
-    sim.set_initial_state(good_initial_qobj)
-    sim.run()
-    sim.set_initial_state(good_initial_qobj_no_dims)
-    sim.run()
-    seq.measure("ground-rydberg")
-    sim.run()
-    assert sim._seq._measurement == "ground-rydberg"
+        run_sim.initial_state = np.r_[
+            1, np.zeros(run_sim.dim**run_sim._size - 1)
+        ]
 
-    sim.run(progress_bar=True)
-    sim.run(progress_bar=False)
-    sim.run(progress_bar=None)
     with pytest.raises(
         ValueError,
         match="`progress_bar` must be a bool.",
     ):
-        sim.run(progress_bar=1)
+        run_sim.run(progress_bar=1)
 
-    sim.set_config(SimConfig("SPAM", eta=0.1))
+    run_sim.set_initial_state(qutip.basis(run_sim.dim**run_sim._size, 2))
+    run_sim.set_config(SimConfig("SPAM", eta=0.1))
     with pytest.raises(
         NotImplementedError,
         match="Can't combine state preparation errors with an initial state "
         "different from the ground.",
     ):
-        sim.run()
+        run_sim.run()
+
+
+@pytest.mark.parametrize("state_type", ["array", "qobj", "qobj_no_dims"])
+def test_run_initial_state(run_sim, state_type):
+    dim, size = run_sim.dim, run_sim._size
+    if state_type == "array":
+        initial_state = np.r_[1, np.zeros(dim**size - 1)]
+    elif state_type == "qobj":
+        initial_state = qutip.tensor([qutip.basis(dim, 0)] * size)
+    else:
+        initial_state = qutip.basis(dim**size, 2)
+    run_sim.set_initial_state(initial_state)
+    run_sim.run()
+
+
+def test_run_measure(short_seq):
+    # The sequence is measured, so work on a copy of the shared one
+    seq = copy.deepcopy(short_seq)
+    sim = Simulation(seq, sampling_rate=0.01)
+    seq.measure("ground-rydberg")
+    sim.run()
+    assert sim._seq._measurement == "ground-rydberg"
+
+
+@pytest.mark.parametrize(
+    "progress_bar, qutip_progress_bar",
+    [(True, True), (False, None), (None, None)],
+)
+def test_run_progress_bar(run_sim, progress_bar, qutip_progress_bar):
+    # Only the argument forwarding is checked, so the solver is mocked out
+    solver_result = SimpleNamespace(
+        states=[run_sim.initial_state] * len(run_sim._eval_times_array)
+    )
+    with patch("qutip.sesolve", return_value=solver_result) as sesolve:
+        run_sim.run(progress_bar=progress_bar)
+    assert sesolve.call_args.kwargs["progress_bar"] is qutip_progress_bar
 
 
-def test_eval_times(seq):
+def test_eval_times(short_seq):
     with pytest.raises(
         ValueError, match="evaluation_times float must be between 0 " "and 1."
     ):
-        sim = Simulation(seq, sampling_rate=1.0)
+        sim = Simulation(short_seq, sampling_rate=1.0)
         sim.set_evaluation_times(3.0)
     with pytest.raises(ValueError, match="Wrong evaluation time label."):
-        sim = Simulation(seq, sampling_rate=1.0)
+        sim = Simulation(short_seq, sampling_rate=1.0)
         sim.set_evaluation_times(123)
     with pytest.raises(ValueError, match="Wrong evaluation time label."):
-        sim = Simulation(seq, sampling_rate=1.0)
+        sim = Simulation(short_seq, sampling_rate=1.0)
         sim.set_evaluation_times("Best")
 
     with pytest.raises(
         ValueError,
         match="Provided evaluation-time list contains " "negative values.",
     ):
-        sim = Simulation(seq, sampling_rate=1.0)
+        sim = Simulation(short_seq, sampling_rate=1.0)
         sim.set_evaluation_times([-1, 0, sim.sampling_times[-2]])
 
     with pytest.raises(
@@ -501,10 +526,10 @@ def test_eval_times(seq):
         match="Provided evaluation-time list extends "
         "further than sequence duration.",
     ):
-        sim = Simulation(seq, sampling_rate=1.0)
+        sim = Simulation(short_seq, sampling_rate=1.0)
         sim.set_evaluation_times([0, sim.sampling_times[-1] + 10])
 
-    sim = Simulation(seq, sampling_rate=1.0)
+    sim = Simulation(short_seq, sampling_rate=1.0)
     with pytest.warns(
         DeprecationWarning, match="Setting `evaluation_times` is deprecated"
     ):
@@ -516,14 +541,14 @@ def test_eval_times(seq):
         sim.sampling_times,
     )
 
-    sim = Simulation(seq, sampling_rate=1.0)
+    sim = Simulation(short_seq, sampling_rate=1.0)
     sim.set_evaluation_times("Minimal")
     np.testing.assert_almost_equal(
         sim._eval_times_array,
         np.array([sim.sampling_times[0], sim._tot_duration / 1000]),
     )
 
-    sim = Simulation(seq, sampling_rate=1.0)
+    sim = Simulation(short_seq, sampling_rate=1.0)
     sim.set_evaluation_times(
         [
             0,
@@ -548,7 +573,7 @@ def test_eval_times(seq):
         np.array([0, sim._tot_duration / 1000]),
     )
 
-    sim = Simulation(seq, sampling_rate=1.0)
+    sim = Simulation(short_seq, sampling_rate=1.0)
     sim.set_evaluation_times([sim.sampling_times[-10], sim.sampling_times[-3]])
     np.testing.assert_almost_equal(
         sim._eval_times_array,
@@ -562,7 +587,7 @@ def test_eval_times(seq):
         ),
     )
 
-    sim = Simulation(seq, sampling_rate=1.0)
+    sim = Simulation(short_seq, sampling_rate=1.0)
     sim.set_evaluation_times(0.4)
     np.testing.assert_almost_equal(
         sim.sampling_times[
@@ -577,14 +602,22 @@ def test_eval_times(seq):
     )
 
 
-def test_config():
-    np.random.seed(123)
-    reg = Register.from_coordinates([(0, 0), (0, 5)], prefix="q")
+def _make_noisy_seq(coords):
+    reg = Register.from_coordinates(coords, prefix="q")
     seq = Sequence(reg, Chadoq2)
     seq.declare_channel("ch0", "rydberg_global")
-    duration = 2500
-    pulse = Pulse.ConstantPulse(duration, np.pi, 0.0 * 2 * np.pi, 0)
-    seq.add(pulse, "ch0")
+    seq.add(Pulse.ConstantPulse(2500, np.pi, 0, 0), "ch0")
+    return seq
+
+
+@pytest.fixture(scope="module")
+def single_atom_seq():
+    return _make_noisy_seq([(0, 0)])
+
+
+def test_config():
+    np.random.seed(123)
+    seq = _make_noisy_seq([(0, 0), (0, 5)])
     sim = Simulation(seq, config=SimConfig(noise="SPAM"))
     sim.reset_config()
     assert sim.config == SimConfig()
@@ -617,9 +650,9 @@ def test_noise(seq, matrices):
         {"000": 857, "110": 73, "100": 70}
     )
     with pytest.raises(NotImplementedError, match="Cannot include"):
-        sim2.set_config(SimConfig(noise="dephasing"))
+        sim2.set_config(_DEPHASING_CFG)
     with pytest.raises(NotImplementedError, match="Cannot include"):
-        sim2.set_config(SimConfig(noise="depolarizing"))
+        sim2.set_config(_DEPOLARIZING_CFG)
     with pytest.raises(NotImplementedError, match="Cannot include"):
         sim2.set_config(
             SimConfig(
@@ -640,71 +673,36 @@ def test_noise(seq, matrices):
             if not sim2._bad_atoms[t]:
                 continue
             for qty in ("amp", "det", "phase"):
-                assert np.all(sim2.samples["Local"][basis][t][qty] == 0.0)
-
-
-def test_dephasing():
-    np.random.seed(123)
-    reg = Register.from_coordinates([(0, 0)], prefix="q")
-    seq = Sequence(reg, Chadoq2)
-    seq.declare_channel("ch0", "rydberg_global")
-    duration = 2500
-    pulse = Pulse.ConstantPulse(duration, np.pi, 0, 0)
-    seq.add(pulse, "ch0")
+                assert not np.any(sim2.samples["Local"][basis][t][qty])
+
+
+@pytest.mark.parametrize(
+    "noise, r_population, counts",
+    [
+        ("dephasing", 0.4351, Counter({"0": 595, "1": 405})),
+        ("depolarizing", 0.4427, Counter({"0": 587, "1": 413})),
+    ],
+)
+def test_dephasing_and_depolarizing(
+    single_atom_seq, noise, r_population, counts
+):
     sim = Simulation(
-        seq, sampling_rate=0.01, config=SimConfig(noise="dephasing")
+        single_atom_seq, sampling_rate=0.01, config=SimConfig(noise=noise)
     )
-    assert sim.run().sample_final_state() == Counter({"0": 595, "1": 405})
-    assert len(sim._collapse_ops) != 0
-    with pytest.warns(UserWarning, match="first-order"):
-        reg = Register.from_coordinates([(0, 0), (0, 10)], prefix="q")
-        seq2 = Sequence(reg, Chadoq2)
-        seq2.declare_channel("ch0", "rydberg_global")
-        seq2.add(pulse, "ch0")
-        sim = Simulation(
-            seq2,
-            sampling_rate=0.01,
-            config=SimConfig(noise="dephasing", dephasing_prob=0.5),
-        )
-
-
-def test_depolarizing():
-    np.random.seed(123)
-    reg = Register.from_coordinates([(0, 0)], prefix="q")
-    seq = Sequence(reg, Chadoq2)
-    seq.declare_channel("ch0", "rydberg_global")
-    duration = 2500
-    pulse = Pulse.ConstantPulse(duration, np.pi, 0, 0)
-    seq.add(pulse, "ch0")
-    sim = Simulation(
-        seq, sampling_rate=0.01, config=SimConfig(noise="depolarizing")
+    res = sim.run()
+    np.testing.assert_allclose(
+        res.states[-1].diag(), [r_population, 1 - r_population], atol=1e-4
     )
-    assert sim.run().sample_final_state() == Counter({"0": 587, "1": 413})
-    trace_2 = sim.run().states[-1] ** 2
+    np.random.seed(123)
+    assert res.sample_final_state() == counts
+    trace_2 = res.states[-1] ** 2
     assert np.trace(trace_2) < 1 and not np.isclose(np.trace(trace_2), 1)
     assert len(sim._collapse_ops) != 0
-    with pytest.warns(UserWarning, match="first-order"):
-        reg = Register.from_coordinates([(0, 0), (0, 10)], prefix="q")
-        seq2 = Sequence(reg, Chadoq2)
-        seq2.declare_channel("ch0", "rydberg_global")
-        seq2.add(pulse, "ch0")
-        sim = Simulation(
-            seq2,
-            sampling_rate=0.01,
-            config=SimConfig(noise="depolarizing", depolarizing_prob=0.5),
-        )
 
 
-def test_eff_noise(matrices):
-    np.random.seed(123)
-    reg = Register.from_coordinates([(0, 0)], prefix="q")
-    seq = Sequence(reg, Chadoq2)
-    seq.declare_channel("ch0", "rydberg_global")
-    duration = 2500
-    pulse = Pulse.ConstantPulse(duration, np.pi, 0, 0)
-    seq.add(pulse, "ch0")
+def test_eff_noise(single_atom_seq, matrices):
     sim = Simulation(
-        seq,
+        single_atom_seq,
         sampling_rate=0.01,
         config=SimConfig(
             noise="eff_noise",
@@ -713,38 +711,40 @@ def test_eff_noise(matrices):
         ),
     )
     sim_dph = Simulation(
-        seq, sampling_rate=0.01, config=SimConfig(noise="dephasing")
+        single_atom_seq,
+        sampling_rate=0.01,
+        config=_DEPHASING_CFG,
     )
     assert (
         sim._collapse_ops == sim_dph._collapse_ops
         and sim.run().states[-1] == sim_dph.run().states[-1]
     )
     assert len(sim._collapse_ops) != 0
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SimConfig(noise="dephasing", dephasing_prob=0.5),
+        SimConfig(noise="depolarizing", depolarizing_prob=0.5),
+        SimConfig(
+            noise="eff_noise",
+            eff_noise_opers=[_QEYE_2, qutip.sigmaz()],
+            eff_noise_probs=[0.5, 0.5],
+        ),
+    ],
+)
+def test_first_order_noise_warning(config):
+    seq = _make_noisy_seq([(0, 0), (0, 10)])
     with pytest.warns(UserWarning, match="first-order"):
-        reg = Register.from_coordinates([(0, 0), (0, 10)], prefix="q")
-        seq2 = Sequence(reg, Chadoq2)
-        seq2.declare_channel("ch0", "rydberg_global")
-        seq2.add(pulse, "ch0")
-        sim = Simulation(
-            seq2,
-            sampling_rate=0.01,
-            config=SimConfig(
-                noise="eff_noise",
-                eff_noise_opers=[matrices["I"], matrices["Z"]],
-                eff_noise_probs=[0.5, 0.5],
-            ),
-        )
+        Simulation(seq, sampling_rate=0.01, config=config)
 
 
-def test_add_config(matrices):
-    reg = Register.from_coordinates([(0, 0)], prefix="q")
-    seq = Sequence(reg, Chadoq2)
-    seq.declare_channel("ch0", "rydberg_global")
-    duration = 2500
-    pulse = Pulse.ConstantPulse(duration, np.pi, 0.0 * 2 * np.pi, 0)
-    seq.add(pulse, "ch0")
+def test_add_config(single_atom_seq, matrices):
     sim = Simulation(
-        seq, sampling_rate=0.01, config=SimConfig(noise="SPAM", eta=0.5)
+        single_atom_seq,
+        sampling_rate=0.01,
+        config=_SPAM_05_CFG,
     )
     with pytest.raises(ValueError, match="is not a valid"):
         sim.add_config("bad_cfg")
@@ -777,8 +777,8 @@ def test_add_config(matrices):
         and "SPAM" in sim.config.noise
     )
     assert sim.config.laser_waist == 172.0
-    sim.set_config(SimConfig(noise="SPAM", eta=0.5))
-    sim.add_config(SimConfig(noise="depolarizing"))
+    sim.set_config(_SPAM_05_CFG)
+    sim.add_config(_DEPOLARIZING_CFG)
     assert "depolarizing" in sim.config.noise
 
 
@@ -802,10 +802,14 @@ def test_concurrent_pulses():
     config_doppler = SimConfig(noise=("doppler"))
     sim_with_noise.set_config(config_doppler)
 
-    for t in sim_no_noise.evaluation_times:
-        ham_no_noise = sim_no_noise.get_hamiltonian(t)
-        ham_with_noise = sim_with_noise.get_hamiltonian(t)
-        assert ham_no_noise[0, 1] == ham_with_noise[0, 1]
+    def rabi_coeffs(sim):
+        # Time-dependent coefficients of the |r><g| + |g><r| term
+        (rabi_op,) = [op for op in sim._hamiltonian.ops if op.qobj[0, 1] != 0]
+        return rabi_op.qobj[0, 1] * rabi_op.coeff
+
+    coeffs_no_noise = rabi_coeffs(sim_no_noise)
+    assert len(coeffs_no_noise) == len(sim_no_noise.evaluation_times)
+    np.testing.assert_array_equal(coeffs_no_noise, rabi_coeffs(sim_with_noise))
 
 
 def test_get_xy_hamiltonian():
@@ -870,13 +874,12 @@ def test_run_xy():
     assert sim._seq._measurement == "XY"
 
 
-def test_noisy_xy():
+def test_noisy_xy(square_reg):
     np.random.seed(15092021)
-    simple_reg = Register.square(2, prefix="atom")
     detun = 1.0
     amp = 3.0
     rise = Pulse.ConstantPulse(1500, amp, detun, 0.0)
-    simple_seq = Sequence(simple_reg, MockDevice)
+    simple_seq = Sequence(square_reg, MockDevice)
     simple_seq.declare_channel("ch0", "mw_global")
     simple_seq.add(rise, "ch0")
 
@@ -886,7 +889,7 @@ def test_noisy_xy():
     ):
         sim.set_config(SimConfig(("SPAM", "doppler")))
 
-    sim.set_config(SimConfig("SPAM", eta=0.4))
+    sim.set_config(_SPAM_04_CFG)
     assert sim._bad_atoms == {
         "atom0": True,
         "atom1": False,
@@ -899,129 +902,170 @@ def test_noisy_xy():
         sim.add_config(SimConfig("amplitude"))
 
 
-def test_mask_nopulses():
+def _stacked_hamiltonians(sim, times, pad_qubit=False):
+    # Dense Hamiltonians at each time, optionally padded with an idle qubit
+    hams = (sim.get_hamiltonian(t) for t in times)
+    if pad_qubit:
+        hams = (qutip.tensor(ham, _QEYE_2) for ham in hams)
+    return np.stack([ham.full() for ham in hams])
+
+
+@pytest.fixture(scope="module")
+def reg_three():
+    return Register({"q0": (0, 0), "q1": (10, 10), "q2": (-10, -10)})
+
+
+@pytest.fixture(scope="module")
+def reg_two():
+    return Register({"q0": (0, 0), "q1": (10, 10)})
+
+
+@pytest.mark.parametrize("channel_type", ["mw_global", "rydberg_global"])
+def test_mask_nopulses(reg_three, channel_type):
     """Check interaction between SLM mask and a simulation with no pulses."""
-    reg = Register({"q0": (0, 0), "q1": (10, 10), "q2": (-10, -10)})
-    for channel_type in ["mw_global", "rydberg_global"]:
-        seq_empty = Sequence(reg, MockDevice)
-        if channel_type == "mw_global":
-            seq_empty.set_magnetic_field(0, 1.0, 0.0)
-        seq_empty.declare_channel("ch", channel_type)
-        seq_empty.delay(duration=100, channel="ch")
-        masked_qubits = ["q2"]
-        seq_empty.config_slm_mask(masked_qubits)
-        sim_empty = Simulation(seq_empty)
-
-        assert seq_empty._slm_mask_time == []
-        assert sim_empty._seq._slm_mask_time == []
-
-
-def test_mask_equals_remove():
+    seq_empty = Sequence(reg_three, MockDevice)
+    if channel_type == "mw_global":
+        seq_empty.set_magnetic_field(0, 1.0, 0.0)
+    seq_empty.declare_channel("ch", channel_type)
+    seq_empty.delay(duration=100, channel="ch")
+    masked_qubits = ["q2"]
+    seq_empty.config_slm_mask(masked_qubits)
+    sim_empty = Simulation(seq_empty)
+
+    assert seq_empty._slm_mask_time == []
+    assert sim_empty._seq._slm_mask_time == []
+
+
+@pytest.mark.parametrize(
+    "channel_type", ["mw_global", "rydberg_global", "raman_global"]
+)
+def test_mask_equals_remove(reg_three, reg_two, channel_type):
     """Check that masking is equivalent to removing the masked qubits.
 
     A global pulse acting on three qubits of which one is masked, should be
     equivalent to acting on a register with only the two unmasked qubits.
     """
-    reg_three = Register({"q0": (0, 0), "q1": (10, 10), "q2": (-10, -10)})
-    reg_two = Register({"q0": (0, 0), "q1": (10, 10)})
     pulse = Pulse.ConstantPulse(100, 10, 0, 0)
     local_pulse = Pulse.ConstantPulse(200, 10, 0, 0)
 
-    for channel_type in ["mw_global", "rydberg_global", "raman_global"]:
-        # Masked simulation
-        seq_masked = Sequence(reg_three, MockDevice)
-        if channel_type == "mw_global":
-            seq_masked.set_magnetic_field(0, 1.0, 0.0)
-        else:
-            # Add a local channel acting on a masked qubit (has no effect)
-            seq_masked.declare_channel(
-                "local",
-                channel_type[: -len("global")] + "local",
-                initial_target="q2",
-            )
-            seq_masked.add(local_pulse, "local")
-        seq_masked.declare_channel("ch_masked", channel_type)
-        masked_qubits = ["q2"]
-        seq_masked.config_slm_mask(masked_qubits)
-        seq_masked.add(pulse, "ch_masked")
-        sim_masked = Simulation(seq_masked)
-        # Simulation cannot be run on a device not having an SLM mask
-        with pytest.raises(
-            ValueError,
-            match="Samples use SLM mask but device does not have one.",
-        ):
-            QutipEmulator(sampler.sample(seq_masked), reg_three, IroiseMVP)
-        # Simulation cannot be run on a register not defining "q2"
-        with pytest.raises(
-            ValueError,
-            match="The ids of qubits targeted in SLM mask",
-        ):
-            QutipEmulator(sampler.sample(seq_masked), reg_two, MockDevice)
-        # Simulation on reduced register
-        seq_two = Sequence(reg_two, MockDevice)
-        if channel_type == "mw_global":
-            seq_two.set_magnetic_field(0, 1.0, 0.0)
-        seq_two.declare_channel("ch_two", channel_type)
-        if channel_type != "mw_global":
-            seq_two.delay(local_pulse.duration, "ch_two")
-        seq_two.add(pulse, "ch_two")
-        sim_two = Simulation(seq_two)
-
-        # Check equality
-        for t in sim_two.sampling_times:
-            ham_masked = sim_masked.get_hamiltonian(t)
-            ham_two = sim_two.get_hamiltonian(t)
-            assert ham_masked == qutip.tensor(ham_two, qutip.qeye(2))
-
-
-def test_mask_two_pulses():
+    # Masked simulation
+    seq_masked = Sequence(reg_three, MockDevice)
+    if channel_type == "mw_global":
+        seq_masked.set_magnetic_field(0, 1.0, 0.0)
+    else:
+        # Add a local channel acting on a masked qubit (has no effect)
+        seq_masked.declare_channel(
+            "local",
+            channel_type[: -len("global")] + "local",
+            initial_target="q2",
+        )
+        seq_masked.add(local_pulse, "local")
+    seq_masked.declare_channel("ch_masked", channel_type)
+    masked_qubits = ["q2"]
+    seq_masked.config_slm_mask(masked_qubits)
+    seq_masked.add(pulse, "ch_masked")
+    sim_masked = Simulation(seq_masked)
+    masked_samples = sampler.sample(seq_masked)
+    # Simulation cannot be run on a device not having an SLM mask
+    with pytest.raises(
+        ValueError,
+        match="Samples use SLM mask but device does not have one.",
+    ):
+        QutipEmulator(masked_samples, reg_three, IroiseMVP)
+    # Simulation cannot be run on a register not defining "q2"
+    with pytest.raises(
+        ValueError,
+        match="The ids of qubits targeted in SLM mask",
+    ):
+        QutipEmulator(masked_samples, reg_two, MockDevice)
+    # Simulation on reduced register
+    seq_two = Sequence(reg_two, MockDevice)
+    if channel_type == "mw_global":
+        seq_two.set_magnetic_field(0, 1.0, 0.0)
+    seq_two.declare_channel("ch_two", channel_type)
+    if channel_type != "mw_global":
+        seq_two.delay(local_pulse.duration, "ch_two")
+    seq_two.add(pulse, "ch_two")
+    sim_two = Simulation(seq_two)
+
+    # Check equality
+    times = sim_two.sampling_times * 1000  # in ns
+    np.testing.assert_allclose(
+        _stacked_hamiltonians(sim_masked, times),
+        _stacked_hamiltonians(sim_two, times, pad_qubit=True),
+        rtol=0,
+        atol=1e-12,
+    )
+
+
+def _make_global_seq(reg, channel_type, pulses, masked_qubits=None):
+    seq = Sequence(reg, MockDevice)
+    seq.declare_channel("ch", channel_type)
+    if masked_qubits is not None:
+        seq.config_slm_mask(masked_qubits)
+    for pulse in pulses:
+        seq.add(pulse, "ch")
+    return seq
+
+
+@pytest.mark.parametrize(
+    "channel_type", ["mw_global", "rydberg_global", "raman_global"]
+)
+def test_mask_two_pulses(reg_three, reg_two, channel_type):
     """Similar to test_mask_equals_remove, but with more pulses afterwards.
 
     Three global pulses act on a three qubit register, with one qubit masked
     during the first pulse.
     """
-    reg_three = Register({"q0": (0, 0), "q1": (10, 10), "q2": (-10, -10)})
-    reg_two = Register({"q0": (0, 0), "q1": (10, 10)})
     pulse = Pulse.ConstantPulse(100, 10, 0, 0)
     no_pulse = Pulse.ConstantPulse(100, 0, 0, 0)
 
-    for channel_type in ["mw_global", "rydberg_global", "raman_global"]:
-        # Masked simulation
-        seq_masked = Sequence(reg_three, MockDevice)
-        seq_masked.declare_channel("ch_masked", channel_type)
-        masked_qubits = ["q2"]
-        seq_masked.config_slm_mask(masked_qubits)
-        seq_masked.add(pulse, "ch_masked")  # First pulse: masked
-        seq_masked.add(pulse, "ch_masked")  # Second pulse: unmasked
-        seq_masked.add(pulse, "ch_masked")  # Third pulse: unmasked
-        sim_masked = Simulation(seq_masked)
-
-        # Unmasked simulation on full register
-        seq_three = Sequence(reg_three, MockDevice)
-        seq_three.declare_channel("ch_three", channel_type)
-        seq_three.add(no_pulse, "ch_three")
-        seq_three.add(pulse, "ch_three")
-        seq_three.add(pulse, "ch_three")
-        sim_three = Simulation(seq_three)
-
-        # Unmasked simulation on reduced register
-        seq_two = Sequence(reg_two, MockDevice)
-        seq_two.declare_channel("ch_two", channel_type)
-        seq_two.add(pulse, "ch_two")
-        seq_two.add(no_pulse, "ch_two")
-        seq_two.add(no_pulse, "ch_two")
-        sim_two = Simulation(seq_two)
-
-        ti = seq_masked._slm_mask_time[0]
-        tf = seq_masked._slm_mask_time[1]
-        for t in sim_masked.sampling_times:
-            ham_masked = sim_masked.get_hamiltonian(t)
-            ham_three = sim_three.get_hamiltonian(t)
-            ham_two = sim_two.get_hamiltonian(t)
-            if ti <= t <= tf:
-                assert ham_masked == qutip.tensor(ham_two, qutip.qeye(2))
-            else:
-                assert ham_masked == ham_three
+    # Masked simulation: only the first pulse is masked
+    seq_masked = _make_global_seq(
+        reg_three, channel_type, [pulse, pulse, pulse], masked_qubits=["q2"]
+    )
+    sim_masked = Simulation(seq_masked)
+
+    # Unmasked simulation on full register
+    sim_three = Simulation(
+        _make_global_seq(reg_three, channel_type, [no_pulse, pulse, pulse])
+    )
+
+    # Unmasked simulation on reduced register
+    sim_two = Simulation(
+        _make_global_seq(reg_two, channel_type, [pulse, no_pulse, no_pulse])
+    )
+
+    ti = seq_masked._slm_mask_time[0]
+    tf = seq_masked._slm_mask_time[1]
+    # The samples are constant within each pulse, so the sequence ends and
+    # the midpoint of each pulse cover every regime. At t == tf the
+    # coefficients switch between the two regimes, so that time matches
+    # neither reference and is left out
+    half_pulse = pulse.duration / 2
+    times = np.array(
+        [
+            ti,
+            ti + half_pulse,
+            tf + half_pulse,
+            tf + 3 * half_pulse,
+            seq_masked.get_duration(),
+        ]
+    )
+    in_mask = (ti <= times) & (times < tf)
+    after_mask = times > tf
+    np.testing.assert_allclose(
+        _stacked_hamiltonians(sim_masked, times[in_mask]),
+        _stacked_hamiltonians(sim_two, times[in_mask], pad_qubit=True),
+        rtol=0,
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        _stacked_hamiltonians(sim_masked, times[after_mask]),
+        _stacked_hamiltonians(sim_three, times[after_mask]),
+        rtol=0,
+        atol=1e-12,
+    )
 
 
 def test_mask_local_channel():
@@ -1040,53 +1084,41 @@ def test_mask_local_channel():
 
     sim = Simulation(seq_)
     for qty in ("amp", "det", "phase"):
-        assert np.all(sim.samples["Local"]["digital"]["q0"][qty] == 0.0)
+        assert not np.any(sim.samples["Local"]["digital"]["q0"][qty])
     assert "q3" not in sim.samples["Local"]["digital"]
 
 
-def test_effective_size_intersection():
-    simple_reg = Register.square(2, prefix="atom")
-    rise = Pulse.ConstantPulse(1500, 0, 0, 0)
-    for channel_type in ["mw_global", "rydberg_global"]:
-        np.random.seed(15092021)
-        seq = Sequence(simple_reg, MockDevice)
-        seq.declare_channel("ch0", channel_type)
-        seq.add(rise, "ch0")
-        seq.config_slm_mask(["atom0"])
-
-        sim = Simulation(seq, sampling_rate=0.01)
-        sim.set_config(SimConfig("SPAM", eta=0.4))
-        assert sim._bad_atoms == {
-            "atom0": True,
-            "atom1": False,
-            "atom2": True,
-            "atom3": False,
-        }
-        assert sim.get_hamiltonian(0) != 0 * sim.build_operator(
-            [("I", "global")]
-        )
+def _spam_sim_with_mask(reg, channel_type, masked_qubit):
+    # A zero-amplitude pulse on a square register where, with this seed,
+    # SPAM with eta=0.4 marks atom0 and atom2 as badly prepared
+    np.random.seed(15092021)
+    seq = Sequence(reg, MockDevice)
+    seq.declare_channel("ch0", channel_type)
+    seq.add(Pulse.ConstantPulse(1500, 0, 0, 0), "ch0")
+    seq.config_slm_mask([masked_qubit])
+    sim = Simulation(seq, sampling_rate=0.01)
+    sim.set_config(_SPAM_04_CFG)
+    assert sim._bad_atoms == {
+        "atom0": True,
+        "atom1": False,
+        "atom2": True,
+        "atom3": False,
+    }
+    return sim
 
 
-def test_effective_size_disjoint():
-    simple_reg = Register.square(2, prefix="atom")
-    rise = Pulse.ConstantPulse(1500, 0, 0, 0)
-    for channel_type in ["mw_global", "rydberg_global", "raman_global"]:
-        np.random.seed(15092021)
-        seq = Sequence(simple_reg, MockDevice)
-        seq.declare_channel("ch0", channel_type)
-        seq.add(rise, "ch0")
-        seq.config_slm_mask(["atom1"])
-        sim = Simulation(seq, sampling_rate=0.01)
-        sim.set_config(SimConfig("SPAM", eta=0.4))
-        assert sim._bad_atoms == {
-            "atom0": True,
-            "atom1": False,
-            "atom2": True,
-            "atom3": False,
-        }
-        assert sim.get_hamiltonian(0) == 0 * sim.build_operator(
-            [("I", "global")]
-        )
+@pytest.mark.parametrize("channel_type", ["mw_global", "rydberg_global"])
+def test_effective_size_intersection(square_reg, channel_type):
+    sim = _spam_sim_with_mask(square_reg, channel_type, "atom0")
+    assert sim.get_hamiltonian(0) != 0 * sim.build_operator([("I", "global")])
+
+
+@pytest.mark.parametrize(
+    "channel_type", ["mw_global", "rydberg_global", "raman_global"]
+)
+def test_effective_size_disjoint(square_reg, channel_type):
+    sim = _spam_sim_with_mask(square_reg, channel_type, "atom1")
+    assert sim.get_hamiltonian(0) == 0 * sim.build_operator([("I", "global")])
 
 
 def test_simulation_with_modulation(mod_device, reg, patch_plt_show):
@@ -1137,29 +1169,37 @@ def test_simulation_with_modulation(mod_device, reg, patch_plt_show):
             raman_samples[qid]["phase"][time_slice], pulse1.phase
         )
 
-    def pos_factor(qid):
-        r = np.linalg.norm(reg.qubits[qid])
-        w0 = sim_config.laser_waist
-        return np.exp(-((r / w0) ** 2))
+    # Gaussian beam profile factor of each qubit
+    qids = list(reg.qubit_ids)
+    radii = np.linalg.norm([reg.qubits[qid] for qid in qids], axis=1)
+    pos_factors = np.exp(-((radii / sim_config.laser_waist) ** 2))
 
     # Global pulse
     time_slice = slice(2 * mod_dt, 3 * mod_dt)
     rydberg_samples = sim.samples["Local"]["ground-rydberg"]
-    noise_amp_base = rydberg_samples["target"]["amp"][time_slice] / (
-        pulse1_mod_samples * pos_factor("target")
-    )
-    for qid in reg.qubit_ids:
-        np.testing.assert_allclose(
-            rydberg_samples[qid]["amp"][time_slice],
-            pulse1_mod_samples * noise_amp_base * pos_factor(qid),
-        )
-        np.testing.assert_equal(
-            rydberg_samples[qid]["det"][time_slice], sim._doppler_detune[qid]
-        )
-        np.testing.assert_allclose(
-            rydberg_samples[qid]["phase"][time_slice], pulse1.phase
+
+    def stacked_samples(qty):
+        return np.stack(
+            [rydberg_samples[qid][qty][time_slice] for qid in qids]
         )
 
+    amp_samples = stacked_samples("amp")
+    target_ind = qids.index("target")
+    noise_amp_base = amp_samples[target_ind] / (
+        pulse1_mod_samples * pos_factors[target_ind]
+    )
+    np.testing.assert_allclose(
+        amp_samples,
+        np.outer(pos_factors, pulse1_mod_samples * noise_amp_base),
+    )
+    det_samples = stacked_samples("det")
+    doppler_detune = np.array([sim._doppler_detune[qid] for qid in qids])
+    np.testing.assert_equal(
+        det_samples,
+        np.broadcast_to(doppler_detune[:, None], det_samples.shape),
+    )
+    np.testing.assert_allclose(stacked_samples("phase"), pulse1.phase)
+
     with pytest.raises(
         ValueError,
         match="Can't draw the interpolation points when the sequence "
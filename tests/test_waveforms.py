@@ -131,6 +131,8 @@ def test_first_last():
 def test_hash():
     assert hash(constant) == hash(tuple(np.full(100, -3)))
     assert hash(ramp) == hash(tuple(np.linspace(5, 19, num=2000)))
+    # The hash is computed only once
+    assert "_hash" in ramp.__dict__
 
 
 def test_composite():
@@ -206,6 +208,13 @@ def test_blackman():
     wf2 = BlackmanWaveform(duration + 1, -area)
     assert np.min(wf2.samples) > np.min(wf.samples) >= -max_val
 
+    # The normalized window is shared between equal durations
+    wf3 = BlackmanWaveform(duration, 2 * area)
+    assert wf3._norm_samples is wf._norm_samples
+    assert not wf3._norm_samples.flags.writeable
+    assert np.allclose(wf3.samples, -2 * wf.samples)
+    assert wf3.samples.flags.writeable
+
 
 def test_interpolated():
     assert isinstance(interp.interp_function, PchipInterpolator)